@@ -9,11 +9,24 @@ from .helpers import (
     search_last_name,
     # Getter functions
     get_last_names,
+    get_last_name_kanji_for_reading,
     get_popular_names,
     # Validation functions
     is_valid_name,
     get_readings_for_kanji,
 )
+from .normalize import normalize_reading, normalize_kanji, normalize_many
+from .blocking import blocking_keys, blocking_keys_many
+from .estimate import estimate_readings, estimate_readings_many
+from .romaji import (
+    romanize,
+    romanize_many,
+    matches_romaji,
+    romaji_candidates,
+    closest_romaji,
+    romaji_to_kana,
+    romaji_to_kana_many,
+)
 
 __version__ = '0.1.1'
 
@@ -25,7 +38,22 @@ __all__ = [
     'search_by_kanji',
     'search_last_name',
     'get_last_names',
+    'get_last_name_kanji_for_reading',
     'get_popular_names',
     'is_valid_name',
     'get_readings_for_kanji',
+    'normalize_reading',
+    'normalize_kanji',
+    'normalize_many',
+    'blocking_keys',
+    'blocking_keys_many',
+    'estimate_readings',
+    'estimate_readings_many',
+    'romanize',
+    'romanize_many',
+    'matches_romaji',
+    'romaji_candidates',
+    'closest_romaji',
+    'romaji_to_kana',
+    'romaji_to_kana_many',
 ]
\ No newline at end of file
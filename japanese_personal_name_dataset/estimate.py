@@ -0,0 +1,272 @@
+"""Reading estimation for kanji names that are not in the dataset.
+
+A per-character reading table is learned from the (reading, kanji) pairs of
+the dataset: single-character names seed the table, then every multi-
+character name is aligned character by character to its reading with the
+current table and the alignments are counted (hard EM). To estimate an
+unseen name, the name is segmented into known units (whole spellings from
+the dataset or single characters) with a memoized dynamic program that
+keeps the best partial readings at each position.
+"""
+
+import math
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Literal, Tuple
+
+from .helpers import _INDEX_CACHE, _get_cached_dataset
+from .normalize import normalize_kanji
+
+
+# Longest reading (in kana) a single kanji may take in an alignment
+_MAX_CHAR_READING = 4
+
+# Alignment passes after seeding from single-character names
+_EM_ITERATIONS = 2
+
+# Log-probability charged for a character/reading pair never seen in training
+_UNSEEN_LOG_PROB = math.log(1e-4)
+
+# Log-probability charged per unit, so fewer, longer units are preferred
+_UNIT_LOG_PENALTY = math.log(0.2)
+
+# Partial readings kept per position in the segmentation DP
+_BEAM_WIDTH = 20
+
+# Kana that cannot begin a mora, so no character's reading may start with them
+_NON_INITIAL = frozenset('ゃゅょぁぃぅぇぉっんー')
+
+UnitTable = Dict[str, Dict[str, float]]
+
+
+def _is_kana(char: str) -> bool:
+    return 'ぁ' <= char <= 'ゖ' or char == 'ー'
+
+
+def _training_pairs(
+    part: Literal['last', 'first', 'any']
+) -> List[Tuple[str, str]]:
+    """Collect normalized (reading, kanji) pairs from the datasets."""
+    pairs = []
+    if part in ('first', 'any'):
+        for names in _get_cached_dataset(kind='org'):
+            for reading, data in names.items():
+                for kanji in data['kanji']:
+                    pairs.append((reading, normalize_kanji(kanji)))
+    if part in ('last', 'any'):
+        _, _, last_names = _get_cached_dataset(include_last_names=True)
+        for kanji, data in last_names.items():
+            pairs.append((data['reading'], normalize_kanji(kanji)))
+    return pairs
+
+
+def _log_probs(counts: Dict[str, Counter]) -> UnitTable:
+    """Turn reading counts per unit into log probabilities."""
+    table = {}
+    for unit, readings in counts.items():
+        total = sum(readings.values())
+        table[unit] = {
+            reading: math.log(count / total)
+            for reading, count in readings.items()
+        }
+    return table
+
+
+def _align(table: UnitTable, reading: str, kanji: str) -> List[str]:
+    """
+    Split reading into one segment per character of kanji, or [] if impossible.
+
+    Segments of kanji characters never start with a kana in _NON_INITIAL,
+    so splits only fall on mora boundaries.
+    """
+    n, m = len(kanji), len(reading)
+    if n == 2 and not _is_kana(kanji[0]) and not _is_kana(kanji[1]):
+        # Fast path for the most common shape: try every split point
+        first, second = table.get(kanji[0], {}), table.get(kanji[1], {})
+        best_score, best_split = None, 0
+        for split in range(max(1, m - _MAX_CHAR_READING), min(m - 1, _MAX_CHAR_READING) + 1):
+            if reading[split] in _NON_INITIAL:
+                continue
+            head, tail = reading[:split], reading[split:]
+            score = (first.get(head, _UNSEEN_LOG_PROB - split)
+                     + second.get(tail, _UNSEEN_LOG_PROB - (m - split)))
+            if best_score is None or score > best_score:
+                best_score, best_split = score, split
+        if best_score is None:
+            return []
+        return [reading[:best_split], reading[best_split:]]
+
+    # best[i][j]: best score aligning kanji[:i] to reading[:j]
+    best = [[None] * (m + 1) for _ in range(n + 1)]
+    back = [[0] * (m + 1) for _ in range(n + 1)]
+    best[0][0] = 0.0
+    for i in range(1, n + 1):
+        char = kanji[i - 1]
+        char_table = table.get(char, {})
+        is_kana = _is_kana(char)
+        for j in range(i, m + 1):
+            for k in range(max(i - 1, j - _MAX_CHAR_READING), j):
+                if best[i - 1][k] is None:
+                    continue
+                segment = reading[k:j]
+                if is_kana:
+                    if segment != char:
+                        continue
+                    log_prob = 0.0
+                elif reading[k] in _NON_INITIAL:
+                    continue
+                else:
+                    log_prob = char_table.get(segment, _UNSEEN_LOG_PROB - len(segment))
+                score = best[i - 1][k] + log_prob
+                if best[i][j] is None or score > best[i][j]:
+                    best[i][j] = score
+                    back[i][j] = k
+    if best[n][m] is None:
+        return []
+    segments = []
+    j = m
+    for i in range(n, 0, -1):
+        k = back[i][j]
+        segments.append(reading[k:j])
+        j = k
+    return segments[::-1]
+
+
+def _learn_char_table(pairs: List[Tuple[str, str]]) -> Dict[str, Counter]:
+    """Learn character -> reading counts from (reading, kanji) pairs."""
+    seed = defaultdict(Counter)
+    compounds = Counter()
+    for reading, kanji in pairs:
+        if len(kanji) > 1:
+            compounds[reading, kanji] += 1
+        elif not _is_kana(kanji):
+            seed[kanji][reading] += 1
+
+    counts = seed
+    for _ in range(_EM_ITERATIONS):
+        table = _log_probs(counts)
+        aligned = defaultdict(Counter)
+        for char, char_counts in seed.items():
+            aligned[char].update(char_counts)
+        for (reading, kanji), weight in compounds.items():
+            for char, segment in zip(kanji, _align(table, reading, kanji)):
+                if not _is_kana(char):
+                    aligned[char][segment] += weight
+        counts = aligned
+    return counts
+
+
+def _get_unit_table(part: Literal['last', 'first', 'any'] = 'any') -> UnitTable:
+    """
+    Get the unit -> {reading: log probability} table from cache or build it.
+
+    Units are every character seen in training plus every multi-character
+    spelling of the dataset.
+    """
+    cache_key = ('reading_units', part)
+    if cache_key not in _INDEX_CACHE:
+        pairs = _training_pairs(part)
+        unit_counts = _learn_char_table(pairs)
+        for reading, kanji in pairs:
+            if len(kanji) > 1:
+                unit_counts[kanji][reading] += 1
+        _INDEX_CACHE[cache_key] = _log_probs(unit_counts)
+    return _INDEX_CACHE[cache_key]
+
+
+def _unit_readings(table: UnitTable, unit: str) -> Dict[str, float]:
+    if len(unit) == 1 and _is_kana(unit):
+        return {unit: 0.0}
+    return table.get(unit, {})
+
+
+@lru_cache(maxsize=4096)
+def _estimate(text: str, part: Literal['last', 'first', 'any']) -> Tuple[Tuple[str, float], ...]:
+    """Rank the readings of a normalized kanji name as (reading, score) pairs."""
+    table = _get_unit_table(part)
+
+    # beams[i]: best partial readings of text[:i] as {reading: log score}
+    beams = [dict() for _ in range(len(text) + 1)]
+    beams[0][''] = 0.0
+    for i in range(len(text)):
+        if len(beams[i]) > _BEAM_WIDTH:
+            kept = sorted(beams[i].items(), key=lambda x: x[1], reverse=True)
+            beams[i] = dict(kept[:_BEAM_WIDTH])
+        for j in range(i + 1, len(text) + 1):
+            for unit_reading, log_prob in _unit_readings(table, text[i:j]).items():
+                for prefix, prefix_score in beams[i].items():
+                    reading = prefix + unit_reading
+                    score = prefix_score + log_prob + _UNIT_LOG_PENALTY
+                    if score > beams[j].get(reading, float('-inf')):
+                        beams[j][reading] = score
+
+    if not beams[-1]:
+        return ()
+    ranked = sorted(beams[-1].items(), key=lambda x: x[1], reverse=True)
+    best = ranked[0][1]
+    norm = best + math.log(sum(math.exp(score - best) for _, score in ranked))
+    return tuple((reading, math.exp(score - norm)) for reading, score in ranked)
+
+
+def estimate_readings(
+    kanji: str,
+    top: int = 5,
+    part: Literal['last', 'first', 'any'] = 'any'
+) -> List[Dict[str, any]]:
+    """
+    Estimate the readings of a kanji name, including names not in the dataset.
+
+    The character reading table is learned on first use, which takes a
+    few seconds; estimates are cached per name afterwards.
+
+    Args:
+        kanji: Last name or first name written in kanji
+        top: Maximum number of candidates to return
+        part: 'last' or 'first' to learn from last or first names only,
+              'any' to use both
+
+    Returns:
+        List of candidates ranked by score (descending), each with
+        'reading' and 'score'. The score is the relative confidence of the
+        reading among all candidates found. Empty if the name contains
+        characters never seen in the dataset.
+
+    Raises:
+        ValueError: If top is less than 1 or part is not 'last', 'first'
+                    or 'any'.
+
+    Examples:
+        >>> estimate_readings('悠真斗', top=1)
+        [{'reading': 'ゆうまと', 'score': 0.42...}]
+    """
+    if part not in ('last', 'first', 'any'):
+        raise ValueError(f"part must be 'last', 'first' or 'any', got '{part}'")
+    if top < 1:
+        raise ValueError(f"top must be at least 1, got {top}")
+
+    text = normalize_kanji(kanji)
+    if not text:
+        return []
+    return [
+        {'reading': reading, 'score': score}
+        for reading, score in _estimate(text, part)[:top]
+    ]
+
+
+def estimate_readings_many(
+    names: Iterable[str],
+    top: int = 5,
+    part: Literal['last', 'first', 'any'] = 'any'
+) -> List[List[Dict[str, any]]]:
+    """
+    Estimate the readings of many kanji names at once.
+
+    Args:
+        names: Names written in kanji
+        top: Maximum number of candidates per name
+        part: See estimate_readings
+
+    Returns:
+        List of candidate lists in input order
+    """
+    return [estimate_readings(name, top=top, part=part) for name in names]
@@ -1,8 +1,10 @@
 """Helper utilities for Japanese personal name dataset."""
 
 import random
+from bisect import bisect_left
 from typing import List, Dict, Literal, Optional, Tuple, Union
 from .core import load_dataset, NameDict, LastNameDict
+from .normalize import normalize_kanji, normalize_reading
 
 
 # Cache for loaded datasets to avoid repeated file reads
@@ -17,6 +19,91 @@ def _get_cached_dataset(kind: Literal['org', 'opti'] = 'org', include_last_names
     return _CACHE[cache_key]
 
 
+# Cache for derived lookup indexes built on top of the cached datasets
+_INDEX_CACHE = {}
+
+
+def _get_name_views(
+    kind: Literal['org', 'opti'] = 'org',
+    normalize: bool = True
+) -> Tuple[Dict[str, Tuple[str, List[str]]], Dict[str, Tuple[str, List[str]]]]:
+    """
+    Get matching views of the first name dicts from cache or build them.
+
+    Returns:
+        Tuple of (man_view, woman_view). Each view maps the (normalized)
+        reading to a (reading, kanji) tuple, where reading is the key of the
+        original name dict and kanji lists the (normalized) spellings in the
+        same order as the original 'kanji' list.
+    """
+    cache_key = ('names', kind, normalize)
+    if cache_key not in _INDEX_CACHE:
+        views = []
+        for names in _get_cached_dataset(kind=kind):
+            if normalize:
+                views.append({
+                    normalize_reading(reading): (
+                        reading, [normalize_kanji(k) for k in data['kanji']]
+                    )
+                    for reading, data in names.items()
+                })
+            else:
+                views.append({
+                    reading: (reading, data['kanji'])
+                    for reading, data in names.items()
+                })
+        _INDEX_CACHE[cache_key] = tuple(views)
+    return _INDEX_CACHE[cache_key]
+
+
+def _get_last_name_kanji_view(normalize: bool = True) -> Dict[str, str]:
+    """Get the kanji -> (normalized) kanji map for last names from cache or build it."""
+    cache_key = ('last_name_kanji', normalize)
+    if cache_key not in _INDEX_CACHE:
+        _, _, last_names = _get_cached_dataset(include_last_names=True)
+        _INDEX_CACHE[cache_key] = {
+            kanji: normalize_kanji(kanji) if normalize else kanji
+            for kanji in last_names
+        }
+    return _INDEX_CACHE[cache_key]
+
+
+def _get_last_name_reading_view(normalize: bool = True) -> Dict[str, str]:
+    """Get the kanji -> (normalized) reading map for last names from cache or build it."""
+    cache_key = ('last_name_reading_view', normalize)
+    if cache_key not in _INDEX_CACHE:
+        _, _, last_names = _get_cached_dataset(include_last_names=True)
+        _INDEX_CACHE[cache_key] = {
+            kanji: normalize_reading(data['reading']) if normalize else data['reading']
+            for kanji, data in last_names.items()
+        }
+    return _INDEX_CACHE[cache_key]
+
+
+def _get_last_name_reading_index(
+    normalize: bool = True
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    """
+    Get the reading -> kanji multimap for last names from cache or build it.
+
+    Returns:
+        Tuple of (index, sorted_readings). index maps each (normalized)
+        hiragana reading to its kanji spellings ordered by population count
+        (descending); sorted_readings lists the index keys in sorted order
+        for prefix lookups with bisect.
+    """
+    cache_key = ('last_name_reading', normalize)
+    if cache_key not in _INDEX_CACHE:
+        _, _, last_names = _get_cached_dataset(include_last_names=True)
+        index = {}
+        for kanji, reading in _get_last_name_reading_view(normalize).items():
+            index.setdefault(reading, []).append(kanji)
+        for kanji_list in index.values():
+            kanji_list.sort(key=lambda k: last_names[k]['count'], reverse=True)
+        _INDEX_CACHE[cache_key] = (index, sorted(index))
+    return _INDEX_CACHE[cache_key]
+
+
 # Random Generation Functions
 
 def generate_random_name(
@@ -96,7 +183,8 @@ def search_by_reading(
     reading: str,
     gender: Optional[Literal['male', 'female']] = None,
     kind: Literal['org', 'opti'] = 'org',
-    partial: bool = False
+    partial: bool = False,
+    normalize: bool = True
 ) -> List[Dict[str, any]]:
     """
     Search names by hiragana reading.
@@ -106,36 +194,36 @@ def search_by_reading(
         gender: If specified, search only male or female names
         kind: 'org' for full dataset, 'opti' for popular names only
         partial: If True, performs LIKE search (partial match)
+        normalize: If True, katakana, half-width kana and spaces in the
+                   query are normalized before matching (see normalize_reading)
 
     Returns:
         List of matching names with their data
     """
     man_names, woman_names = _get_cached_dataset(kind=kind)
+    man_view, woman_view = _get_name_views(kind=kind, normalize=normalize)
+    if normalize:
+        reading = normalize_reading(reading)
     results = []
 
-    def search_in_dict(names: NameDict, gender_label: str):
-        for name_reading, data in names.items():
-            if partial:
-                if reading in name_reading:
-                    results.append({
-                        'reading': name_reading,
-                        'romaji': data['en'],
-                        'kanji': data['kanji'],
-                        'gender': gender_label
-                    })
-            else:
-                if name_reading == reading:
-                    results.append({
-                        'reading': name_reading,
-                        'romaji': data['en'],
-                        'kanji': data['kanji'],
-                        'gender': gender_label
-                    })
+    def search_in_dict(names: NameDict, view, gender_label: str):
+        if partial:
+            matches = [name_reading for key, (name_reading, _) in view.items() if reading in key]
+        else:
+            matches = [view[reading][0]] if reading in view else []
+        for name_reading in matches:
+            data = names[name_reading]
+            results.append({
+                'reading': name_reading,
+                'romaji': data['en'],
+                'kanji': data['kanji'],
+                'gender': gender_label
+            })
 
     if gender is None or gender == 'male':
-        search_in_dict(man_names, 'male')
+        search_in_dict(man_names, man_view, 'male')
     if gender is None or gender == 'female':
-        search_in_dict(woman_names, 'female')
+        search_in_dict(woman_names, woman_view, 'female')
 
     return results
 
@@ -144,7 +232,8 @@ def search_by_kanji(
     kanji: str,
     gender: Optional[Literal['male', 'female']] = None,
     kind: Literal['org', 'opti'] = 'org',
-    partial: bool = False
+    partial: bool = False,
+    normalize: bool = True
 ) -> List[Dict[str, any]]:
     """
     Search names by kanji.
@@ -154,37 +243,38 @@ def search_by_kanji(
         gender: If specified, search only male or female names
         kind: 'org' for full dataset, 'opti' for popular names only
         partial: If True, performs LIKE search (partial match)
+        normalize: If True, variant kanji and spaces are folded on both the
+                   query and the dataset before matching (see normalize_kanji)
 
     Returns:
         List of matching names with their data
     """
     man_names, woman_names = _get_cached_dataset(kind=kind)
+    man_view, woman_view = _get_name_views(kind=kind, normalize=normalize)
+    if normalize:
+        kanji = normalize_kanji(kanji)
     results = []
 
-    def search_in_dict(names: NameDict, gender_label: str):
-        for reading, data in names.items():
-            for k in data['kanji']:
+    def search_in_dict(names: NameDict, view, gender_label: str):
+        for name_reading, view_kanji in view.values():
+            data = names[name_reading]
+            for k, view_k in zip(data['kanji'], view_kanji):
                 if partial:
-                    if kanji in k:
-                        results.append({
-                            'reading': reading,
-                            'romaji': data['en'],
-                            'kanji': k,
-                            'gender': gender_label
-                        })
+                    match = kanji in view_k
                 else:
-                    if k == kanji:
-                        results.append({
-                            'reading': reading,
-                            'romaji': data['en'],
-                            'kanji': k,
-                            'gender': gender_label
-                        })
+                    match = view_k == kanji
+                if match:
+                    results.append({
+                        'reading': name_reading,
+                        'romaji': data['en'],
+                        'kanji': k,
+                        'gender': gender_label
+                    })
 
     if gender is None or gender == 'male':
-        search_in_dict(man_names, 'male')
+        search_in_dict(man_names, man_view, 'male')
     if gender is None or gender == 'female':
-        search_in_dict(woman_names, 'female')
+        search_in_dict(woman_names, woman_view, 'female')
 
     return results
 
@@ -193,7 +283,8 @@ def search_last_name(
     query: str,
     search_by: Literal['kanji', 'reading'] = 'kanji',
     partial: bool = False,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    normalize: bool = True
 ) -> List[Dict[str, any]]:
     """
     Search last names.
@@ -203,11 +294,22 @@ def search_last_name(
         search_by: 'kanji' or 'reading'
         partial: If True, performs LIKE search (partial match)
         limit: Maximum number of results to return
+        normalize: If True, the query and the dataset are normalized before
+                   matching (see normalize_kanji and normalize_reading)
 
     Returns:
         List of matching last names with their data
     """
+    if search_by == 'reading' and not partial:
+        return get_last_name_kanji_for_reading(query, limit=limit, normalize=normalize)
+
     _, _, last_names = _get_cached_dataset(include_last_names=True)
+    if search_by == 'kanji':
+        view = _get_last_name_kanji_view(normalize=normalize)
+    else:
+        view = _get_last_name_reading_view(normalize=normalize)
+    if normalize:
+        query = normalize_kanji(query) if search_by == 'kanji' else normalize_reading(query)
     results = []
 
     for kanji, data in last_names.items():
@@ -215,14 +317,11 @@ def search_last_name(
 
         if search_by == 'kanji':
             if partial:
-                match = query in kanji
+                match = query in view[kanji]
             else:
-                match = kanji == query
+                match = view[kanji] == query
         else:  # search_by == 'reading'
-            if partial:
-                match = query in data['reading']
-            else:
-                match = data['reading'] == query
+            match = query in view[kanji]
 
         if match:
             results.append({
@@ -241,6 +340,62 @@ def search_last_name(
     return results
 
 
+def get_last_name_kanji_for_reading(
+    reading: str,
+    prefix: bool = False,
+    limit: Optional[int] = None,
+    normalize: bool = True
+) -> List[Dict[str, any]]:
+    """
+    Get the kanji spellings of last names with a given hiragana reading.
+
+    Uses a prebuilt reading -> kanji index, so lookups do not scan the
+    whole last name table.
+
+    Args:
+        reading: Hiragana reading to look up
+        prefix: If True, match every reading that starts with `reading`
+        limit: Maximum number of results to return
+        normalize: If True, the query and the dataset readings are
+                   normalized before lookup (katakana, half-width kana,
+                   spaces); if False, readings must match exactly
+
+    Returns:
+        List of matching last names sorted by population (descending)
+
+    Examples:
+        >>> [r['kanji'] for r in get_last_name_kanji_for_reading('さいとう')]
+        ['斎藤', '斉藤', '齋藤', '齊藤']
+    """
+    _, _, last_names = _get_cached_dataset(include_last_names=True)
+    index, sorted_readings = _get_last_name_reading_index(normalize=normalize)
+    if normalize:
+        reading = normalize_reading(reading)
+
+    if prefix:
+        kanji_list = []
+        i = bisect_left(sorted_readings, reading)
+        while i < len(sorted_readings) and sorted_readings[i].startswith(reading):
+            kanji_list.extend(index[sorted_readings[i]])
+            i += 1
+        kanji_list.sort(key=lambda k: last_names[k]['count'], reverse=True)
+    else:
+        kanji_list = index.get(reading, [])
+
+    if limit:
+        kanji_list = kanji_list[:limit]
+
+    return [
+        {
+            'kanji': kanji,
+            'reading': last_names[kanji]['reading'],
+            'romaji': last_names[kanji]['en'],
+            'count': last_names[kanji]['count']
+        }
+        for kanji in kanji_list
+    ]
+
+
 # Getter Functions
 
 def get_last_names(
@@ -314,7 +469,8 @@ def is_valid_name(
     kanji: str,
     reading: str,
     gender: Optional[Literal['male', 'female']] = None,
-    kind: Literal['org', 'opti'] = 'org'
+    kind: Literal['org', 'opti'] = 'org',
+    normalize: bool = True
 ) -> bool:
     """
     Validate if a kanji-reading pair exists in the dataset.
@@ -324,29 +480,35 @@ def is_valid_name(
         reading: Hiragana reading to validate
         gender: If specified, check only male or female names
         kind: 'org' for full dataset, 'opti' for popular names only
+        normalize: If True, both the pair and the dataset are normalized
+                   before matching, so e.g. ('髙志', 'タカシ') is accepted
 
     Returns:
         True if the kanji-reading pair exists, False otherwise
     """
-    man_names, woman_names = _get_cached_dataset(kind=kind)
-
-    def check_in_dict(names: NameDict) -> bool:
-        if reading in names:
-            return kanji in names[reading]['kanji']
+    man_view, woman_view = _get_name_views(kind=kind, normalize=normalize)
+    if normalize:
+        kanji = normalize_kanji(kanji)
+        reading = normalize_reading(reading)
+
+    def check_in_dict(view) -> bool:
+        if reading in view:
+            return kanji in view[reading][1]
         return False
 
     if gender is None:
-        return check_in_dict(man_names) or check_in_dict(woman_names)
+        return check_in_dict(man_view) or check_in_dict(woman_view)
     elif gender == 'male':
-        return check_in_dict(man_names)
+        return check_in_dict(man_view)
     else:
-        return check_in_dict(woman_names)
+        return check_in_dict(woman_view)
 
 
 def get_readings_for_kanji(
     kanji: str,
     gender: Optional[Literal['male', 'female']] = None,
-    kind: Literal['org', 'opti'] = 'org'
+    kind: Literal['org', 'opti'] = 'org',
+    normalize: bool = True
 ) -> List[Dict[str, str]]:
     """
     Get all possible readings for a given kanji name.
@@ -355,11 +517,14 @@ def get_readings_for_kanji(
         kanji: Kanji name
         gender: If specified, search only male or female names
         kind: 'org' for full dataset, 'opti' for popular names only
+        normalize: If True, variant kanji are folded before matching
 
     Returns:
         List of possible readings with romaji
     """
-    results = search_by_kanji(kanji, gender=gender, kind=kind, partial=False)
+    results = search_by_kanji(
+        kanji, gender=gender, kind=kind, partial=False, normalize=normalize
+    )
 
     # Deduplicate by reading
     seen = set()
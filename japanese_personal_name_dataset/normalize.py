@@ -0,0 +1,156 @@
+"""Normalization of name strings for search and validation.
+
+Real-world inputs mix half-width kana, full-width ASCII, katakana readings,
+old-form (旧字体) and variant (異体字) kanji, and stray spaces. The functions
+in this module fold them onto the representation used by the dataset
+(hiragana readings, new-form kanji) using translate tables that are built
+once at import time.
+"""
+
+import unicodedata
+from typing import Dict, Iterable, List, Literal
+
+
+# Old-form and variant kanji commonly found in personal names, folded onto
+# the form used by most spellings in the dataset.
+VARIANT_KANJI = {
+    '髙': '高', '﨑': '崎', '嵜': '崎', '碕': '崎', '齋': '斎', '齊': '斉',
+    '邊': '辺', '邉': '辺', '澤': '沢', '濱': '浜', '濵': '浜', '廣': '広',
+    '國': '国', '櫻': '桜', '嶋': '島', '嶌': '島', '藏': '蔵', '眞': '真',
+    '德': '徳', '惠': '恵', '榮': '栄', '實': '実', '壽': '寿', '禮': '礼',
+    '靜': '静', '淺': '浅', '瀨': '瀬', '萬': '万', '彌': '弥', '與': '与',
+    '藝': '芸', '團': '団', '傳': '伝', '圓': '円', '應': '応', '條': '条',
+    '會': '会', '曾': '曽', '增': '増', '黑': '黒', '繪': '絵', '穗': '穂',
+    '豐': '豊', '兒': '児', '乘': '乗', '來': '来', '亞': '亜', '壹': '壱',
+    '勳': '勲', '縣': '県', '曉': '暁', '莊': '荘', '冨': '富', '槇': '槙',
+    '𠮷': '吉', '桒': '桑', '晉': '晋', '埜': '野',
+}
+
+# Characters dropped from all inputs (ASCII and ideographic spaces, tabs, ...)
+_WHITESPACE = ' \t\r\n\u3000\u00a0'
+
+# Combining (semi-)voiced sound marks left by half-width kana such as 'ｶﾞ'
+_COMBINING_MARKS = '\u3099\u309a'
+
+
+def _build_width_table() -> Dict[int, str]:
+    """Map half/full-width forms and compatibility ideographs via NFKC."""
+    table = {}
+    for code in list(range(0xFF01, 0xFFEF)) + list(range(0xF900, 0xFB00)):
+        char = chr(code)
+        folded = unicodedata.normalize('NFKC', char)
+        if folded != char:
+            table[code] = folded
+    return table
+
+
+def _katakana_to_hiragana(text: str) -> str:
+    return ''.join(
+        chr(ord(c) - 0x60) if 'ァ' <= c <= 'ヶ' else c
+        for c in text
+    )
+
+
+def _build_tables():
+    width = _build_width_table()
+    blank = {ord(c): None for c in _WHITESPACE}
+
+    reading = dict(width)
+    reading.update({
+        code: _katakana_to_hiragana(value) for code, value in width.items()
+    })
+    reading.update({
+        code: chr(code - 0x60) for code in range(ord('ァ'), ord('ヶ') + 1)
+    })
+    reading.update(blank)
+
+    kanji = dict(width)
+    kanji.update({
+        code: VARIANT_KANJI.get(value, value) for code, value in width.items()
+    })
+    kanji.update({ord(k): v for k, v in VARIANT_KANJI.items()})
+    kanji.update(blank)
+    return reading, kanji
+
+
+_READING_TABLE, _KANJI_TABLE = _build_tables()
+
+
+def _compose(text: str) -> str:
+    """Recombine kana and sound marks split by half-width input."""
+    for mark in _COMBINING_MARKS:
+        if mark in text:
+            return unicodedata.normalize('NFC', text)
+    return text
+
+
+def normalize_reading(text: str) -> str:
+    """
+    Normalize a reading to the dataset's hiragana form.
+
+    Converts half-width and full-width katakana to hiragana, full-width
+    ASCII to ASCII, and removes whitespace.
+
+    Args:
+        text: Reading in hiragana or katakana
+
+    Returns:
+        Normalized reading
+
+    Examples:
+        >>> normalize_reading('ｻｲﾄｳ')
+        'さいとう'
+        >>> normalize_reading(' タロウ ')
+        'たろう'
+    """
+    return _compose(text.translate(_READING_TABLE))
+
+
+def normalize_kanji(text: str) -> str:
+    """
+    Normalize a kanji name for matching.
+
+    Folds old-form and variant kanji (see VARIANT_KANJI) and compatibility
+    ideographs onto their common form, converts width variants, and removes
+    whitespace. Kana contained in the name are kept as written.
+
+    Args:
+        text: Name written in kanji
+
+    Returns:
+        Normalized kanji name
+
+    Examples:
+        >>> normalize_kanji('髙橋')
+        '高橋'
+        >>> normalize_kanji('齋藤 ')
+        '斎藤'
+    """
+    return _compose(text.translate(_KANJI_TABLE))
+
+
+def normalize_many(
+    texts: Iterable[str],
+    kind: Literal['reading', 'kanji'] = 'reading'
+) -> List[str]:
+    """
+    Normalize many strings at once, e.g. for ingestion jobs.
+
+    Args:
+        texts: Strings to normalize
+        kind: 'reading' to apply normalize_reading, 'kanji' to apply
+              normalize_kanji
+
+    Returns:
+        List of normalized strings in input order
+
+    Raises:
+        ValueError: If kind is not 'reading' or 'kanji'.
+    """
+    if kind == 'reading':
+        table = _READING_TABLE
+    elif kind == 'kanji':
+        table = _KANJI_TABLE
+    else:
+        raise ValueError(f"kind must be 'reading' or 'kanji', got '{kind}'")
+    return [_compose(text.translate(table)) for text in texts]
@@ -0,0 +1,643 @@
+"""Hiragana to romaji conversion.
+
+The tables and tokenization rules mirror the QA tooling used to validate
+the romaji column of the dataset, so conversions made at runtime agree with
+what the dataset checks accept. romanize() spells readings in one of
+several romanization styles; the styles share one Hepburn mora table and
+differ only in how long vowels, ん and っち are written.
+"""
+
+import itertools
+import unicodedata
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Iterator, List, Literal, Optional, Tuple
+
+from .helpers import _INDEX_CACHE, _get_cached_dataset
+from .normalize import normalize_reading
+
+
+BASIC = {
+    'あ': 'a', 'い': 'i', 'う': 'u', 'え': 'e', 'お': 'o',
+    'か': 'ka', 'き': 'ki', 'く': 'ku', 'け': 'ke', 'こ': 'ko',
+    'さ': 'sa', 'し': 'shi', 'す': 'su', 'せ': 'se', 'そ': 'so',
+    'た': 'ta', 'ち': 'chi', 'つ': 'tsu', 'て': 'te', 'と': 'to',
+    'な': 'na', 'に': 'ni', 'ぬ': 'nu', 'ね': 'ne', 'の': 'no',
+    'は': 'ha', 'ひ': 'hi', 'ふ': 'fu', 'へ': 'he', 'ほ': 'ho',
+    'ま': 'ma', 'み': 'mi', 'む': 'mu', 'め': 'me', 'も': 'mo',
+    'や': 'ya', 'ゆ': 'yu', 'よ': 'yo',
+    'ら': 'ra', 'り': 'ri', 'る': 'ru', 'れ': 're', 'ろ': 'ro',
+    'わ': 'wa', 'ゐ': 'i', 'ゑ': 'e', 'を': 'o',
+    'が': 'ga', 'ぎ': 'gi', 'ぐ': 'gu', 'げ': 'ge', 'ご': 'go',
+    'ざ': 'za', 'じ': 'ji', 'ず': 'zu', 'ぜ': 'ze', 'ぞ': 'zo',
+    'だ': 'da', 'ぢ': 'ji', 'づ': 'zu', 'で': 'de', 'ど': 'do',
+    'ば': 'ba', 'び': 'bi', 'ぶ': 'bu', 'べ': 'be', 'ぼ': 'bo',
+    'ぱ': 'pa', 'ぴ': 'pi', 'ぷ': 'pu', 'ぺ': 'pe', 'ぽ': 'po',
+    'ぁ': 'a', 'ぃ': 'i', 'ぅ': 'u', 'ぇ': 'e', 'ぉ': 'o',
+    'ゔ': 'vu',
+}
+
+YOUON = {
+    'きゃ': 'kya', 'きゅ': 'kyu', 'きょ': 'kyo',
+    'しゃ': 'sha', 'しゅ': 'shu', 'しょ': 'sho',
+    'ちゃ': 'cha', 'ちゅ': 'chu', 'ちょ': 'cho',
+    'にゃ': 'nya', 'にゅ': 'nyu', 'にょ': 'nyo',
+    'ひゃ': 'hya', 'ひゅ': 'hyu', 'ひょ': 'hyo',
+    'みゃ': 'mya', 'みゅ': 'myu', 'みょ': 'myo',
+    'りゃ': 'rya', 'りゅ': 'ryu', 'りょ': 'ryo',
+    'ぎゃ': 'gya', 'ぎゅ': 'gyu', 'ぎょ': 'gyo',
+    'じゃ': 'ja', 'じゅ': 'ju', 'じょ': 'jo',
+    'ぢゃ': 'ja', 'ぢゅ': 'ju', 'ぢょ': 'jo',
+    'びゃ': 'bya', 'びゅ': 'byu', 'びょ': 'byo',
+    'ぴゃ': 'pya', 'ぴゅ': 'pyu', 'ぴょ': 'pyo',
+}
+
+# Marker tokens for sokuon (っ), hatsuon (ん) and the long vowel mark (ー)
+SOKUON = 'Q'
+HATSUON = 'N'
+CHOUON = 'H'
+
+_SMALL_YOUON = 'ゃゅょ'
+_VOWELS = 'aiueo'
+
+
+def tokenize(reading: str) -> List[str]:
+    """
+    Split a hiragana reading into mora tokens.
+
+    Sokuon, hatsuon and the long vowel mark are returned as the marker
+    tokens 'Q', 'N' and 'H'.
+
+    Args:
+        reading: Hiragana reading
+
+    Returns:
+        List of mora tokens
+
+    Raises:
+        ValueError: If the reading contains characters that cannot be
+                    split into morae (e.g. a stray small ゃ).
+
+    Examples:
+        >>> tokenize('きょうこ')
+        ['きょ', 'う', 'こ']
+        >>> tokenize('けんいち')
+        ['け', 'N', 'い', 'ち']
+    """
+    tokens = []
+    i = 0
+    while i < len(reading):
+        ch = reading[i]
+        if ch == 'っ':
+            tokens.append(SOKUON)
+            i += 1
+        elif ch == 'ん':
+            tokens.append(HATSUON)
+            i += 1
+        elif ch == 'ー':
+            tokens.append(CHOUON)
+            i += 1
+        elif i + 1 < len(reading) and reading[i:i + 2] in YOUON:
+            tokens.append(reading[i:i + 2])
+            i += 2
+        elif ch in _SMALL_YOUON or ch not in BASIC:
+            raise ValueError(f"Cannot split {ch!r} into morae (in {reading!r})")
+        else:
+            tokens.append(ch)
+            i += 1
+    return tokens
+
+
+def _next_real(tokens: List[str], idx: int) -> Optional[str]:
+    """Return the first non-marker token after idx."""
+    j = idx + 1
+    while j < len(tokens) and tokens[j] in (SOKUON, CHOUON, HATSUON):
+        j += 1
+    return tokens[j] if j < len(tokens) else None
+
+
+RomajiStyle = Literal['hepburn', 'macron', 'wapuro']
+
+# Hepburn spelling of every mora token, shared by all styles
+_MORA_TABLE = {**BASIC, **YOUON}
+
+_MACRONS = {'a': 'ā', 'i': 'ī', 'u': 'ū', 'e': 'ē', 'o': 'ō'}
+
+# Vowel kana that lengthen the preceding mora when it ends in the given vowel,
+# per style:
+#   hepburn: passport Hepburn (外務省ヘボン式), long vowels dropped
+#   macron: revised Hepburn, long vowels marked with a macron
+#   wapuro: long vowels written out as kana (the dataset's "wapuro")
+_LONG_VOWELS = {
+    'hepburn': {('o', 'う'), ('o', 'お'), ('u', 'う')},
+    'macron': {('o', 'う'), ('o', 'お'), ('u', 'う'), ('a', 'あ'), ('e', 'え')},
+    'wapuro': set(),
+}
+
+
+def _romanize_tokens(tokens: List[str], style: str) -> str:
+    """Spell mora tokens in the given style."""
+    table = _MORA_TABLE
+    long_vowels = _LONG_VOWELS[style]
+    parts = []
+    last = None  # index in parts of the last mora ending in a vowel
+    for idx, tok in enumerate(tokens):
+        if tok == SOKUON:
+            nxt = _next_real(tokens, idx)
+            if nxt is None:
+                parts.append('')
+            else:
+                r = table[nxt]
+                parts.append('t' if r.startswith('ch') and style != 'wapuro' else r[0])
+            last = None
+        elif tok == HATSUON:
+            nxt = tokens[idx + 1] if idx + 1 < len(tokens) else None
+            r = table[nxt] if nxt not in (None, SOKUON, HATSUON, CHOUON) else ''
+            if style == 'hepburn' and r[:1] in ('b', 'm', 'p'):
+                parts.append('m')
+            elif style == 'macron' and r[:1] in ('a', 'i', 'u', 'e', 'o', 'y'):
+                parts.append("n'")
+            else:
+                parts.append('n')
+            last = None
+        elif tok == CHOUON:
+            vowel = parts[last][-1] if last is not None else ''
+            if style == 'wapuro':
+                parts.append(vowel)
+            elif style == 'macron' and vowel:
+                parts[last] = parts[last][:-1] + _MACRONS[vowel]
+            last = None
+        else:
+            r = table[tok]
+            vowel = parts[last][-1] if last is not None else ''
+            if (vowel, tok) in long_vowels:
+                if style == 'macron':
+                    parts[last] = parts[last][:-1] + _MACRONS[vowel]
+                last = None
+                continue
+            parts.append(r)
+            last = len(parts) - 1 if r[-1] in _VOWELS else None
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=65536)
+def _romanize(reading: str, style: str) -> str:
+    return ' '.join(
+        _romanize_tokens(tokenize(normalize_reading(part)), style)
+        for part in reading.split()
+    )
+
+
+def romanize(reading: str, style: RomajiStyle = 'hepburn') -> str:
+    """
+    Spell a reading (or a space-separated full name) in romaji.
+
+    Styles:
+        'hepburn': passport Hepburn. Long o/u are not written, ん before
+                   b/m/p is 'm' and っち is 'tchi' (さとう -> sato).
+        'macron': revised Hepburn. Long vowels take a macron and ん before
+                  a vowel or y is "n'" (さとう -> satō, けんいち -> ken'ichi).
+        'wapuro': Hepburn morae with long vowels written out as in the
+                  kana (さとう -> satou, かをる -> kaoru).
+
+    Args:
+        reading: Reading in hiragana or katakana; parts separated by
+                 whitespace (e.g. 'さとう たろう') are romanized separately
+        style: Romanization style
+
+    Returns:
+        Lowercase romaji, with parts joined by a single space
+
+    Raises:
+        ValueError: If style is unknown or the reading cannot be split
+                    into morae.
+
+    Examples:
+        >>> romanize('さとう じゅんいち')
+        'sato junichi'
+        >>> romanize('さとう じゅんいち', style='macron')
+        "satō jun'ichi"
+    """
+    if style not in _LONG_VOWELS:
+        raise ValueError(
+            f"style must be one of {sorted(_LONG_VOWELS)}, got '{style}'"
+        )
+    return _romanize(reading, style)
+
+
+def romanize_many(
+    readings: Iterable[str],
+    style: RomajiStyle = 'hepburn'
+) -> List[str]:
+    """
+    Spell many readings in romaji at once.
+
+    Args:
+        readings: Readings or full names, see romanize
+        style: Romanization style
+
+    Returns:
+        List of romaji in input order
+
+    Raises:
+        ValueError: If style is unknown or a reading cannot be split into
+                    morae.
+    """
+    if style not in _LONG_VOWELS:
+        raise ValueError(
+            f"style must be one of {sorted(_LONG_VOWELS)}, got '{style}'"
+        )
+    return [_romanize(reading, style) for reading in readings]
+
+
+# Accepted spellings
+#
+# The dataset mixes romanization styles (kana-as-written, shortened long
+# vowels, and mixtures of both within one name), so a romaji spelling is
+# accepted for a reading if, at every mora, it uses one of that mora's
+# alternatives below.
+
+_LONG_AFTER = {('a', 'あ'), ('i', 'い'), ('u', 'う'), ('e', 'え'), ('o', 'お'),
+               ('o', 'う'), ('e', 'い')}
+
+
+def _alternatives(tokens: List[str]) -> List[List[str]]:
+    """Return the accepted romaji alternatives for each mora token."""
+    table = _MORA_TABLE
+    alts = []
+    prev_vowel = None  # final vowel of the previous mora, skipping Q and H
+    for idx, tok in enumerate(tokens):
+        if tok == SOKUON:
+            nxt = _next_real(tokens, idx)
+            if nxt is None:
+                alts.append([''])
+            elif table[nxt].startswith('ch'):
+                alts.append(['t', 'c'])  # っち -> tchi / cchi
+            else:
+                alts.append([table[nxt][0]])
+        elif tok == HATSUON:
+            nxt = tokens[idx + 1] if idx + 1 < len(tokens) else None
+            options = ['n']
+            if nxt not in (None, SOKUON, HATSUON, CHOUON):
+                head = table[nxt][0]
+                if head in 'bmp':
+                    options.append('m')
+                if head in _VOWELS or head == 'y':
+                    options.append("n'")
+            alts.append(options)
+            prev_vowel = None
+        elif tok == CHOUON:
+            alts.append([prev_vowel, ''] if prev_vowel else [''])
+        else:
+            base = table[tok]
+            if (prev_vowel, tok) in _LONG_AFTER:
+                alts.append([base, ''])
+            else:
+                alts.append([base])
+            prev_vowel = base[-1] if base[-1] in _VOWELS else None
+    return alts
+
+
+def matches_romaji(reading: str, romaji: str) -> bool:
+    """
+    Check whether a romaji spelling is accepted for a reading.
+
+    Long vowels may be written as kana (satou) or shortened (sato) at each
+    site independently, ん may be n, m (before b/m/p) or n' (before a vowel
+    or y), and っち may be tchi or cchi. The romaji is matched against the
+    mora stream as a small NFA, so the cost is linear in the length of the
+    reading instead of exponential in its number of long vowels.
+
+    Args:
+        reading: Hiragana reading
+        romaji: Romaji spelling to check (compared case-sensitively)
+
+    Returns:
+        True if romaji is one of the accepted spellings of reading
+
+    Raises:
+        ValueError: If the reading cannot be split into morae.
+
+    Examples:
+        >>> matches_romaji('あいいちろう', 'aichirou')
+        True
+        >>> matches_romaji('さとう', 'satoh')
+        False
+    """
+    positions = {0}
+    for options in _alternatives(tokenize(reading)):
+        positions = {
+            pos + len(option)
+            for pos in positions
+            for option in options
+            if romaji.startswith(option, pos)
+        }
+        if not positions:
+            return False
+    return len(romaji) in positions
+
+
+def romaji_candidates(reading: str) -> Iterator[str]:
+    """
+    Enumerate the accepted romaji spellings of a reading.
+
+    The number of spellings grows exponentially with the number of long
+    vowels, so they are generated lazily; use matches_romaji() to test a
+    single spelling.
+
+    Args:
+        reading: Hiragana reading
+
+    Yields:
+        Each accepted spelling once
+
+    Raises:
+        ValueError: If the reading cannot be split into morae.
+    """
+    seen = set()
+    for combo in itertools.product(*_alternatives(tokenize(reading))):
+        candidate = ''.join(combo)
+        if candidate not in seen:
+            seen.add(candidate)
+            yield candidate
+
+
+def closest_romaji(reading: str, romaji: str) -> Tuple[str, int]:
+    """
+    Find the accepted romaji spelling of a reading closest to a given one.
+
+    Useful to propose a fix for a romaji column that matches_romaji()
+    rejects. The edit distance is computed against the mora alternatives
+    directly, one Levenshtein row per alternative, so the spellings of
+    romaji_candidates() are never enumerated. Ties are broken in favour of
+    the earlier alternative, i.e. the long vowel written out.
+
+    Args:
+        reading: Hiragana reading
+        romaji: Romaji spelling to correct (compared case-sensitively, like
+                matches_romaji)
+
+    Returns:
+        Tuple of (closest accepted spelling, edit distance). The distance is
+        0 if romaji is already accepted.
+
+    Raises:
+        ValueError: If the reading cannot be split into morae.
+
+    Examples:
+        >>> closest_romaji('しんじ', 'sinji')
+        ('shinji', 1)
+        >>> closest_romaji('さとう', 'sato')
+        ('sato', 0)
+    """
+    # row[j]: (distance, spelling) of the best spelling so far against romaji[:j]
+    row = [(j, '') for j in range(len(romaji) + 1)]
+    for options in _alternatives(tokenize(reading)):
+        best = None
+        for option in options:
+            cur = row
+            for char in option:
+                nxt = [(cur[0][0] + 1, cur[0][1] + char)]
+                for j in range(1, len(romaji) + 1):
+                    nxt.append(min(
+                        (cur[j][0] + 1, cur[j][1] + char),
+                        (cur[j - 1][0] + (char != romaji[j - 1]), cur[j - 1][1] + char),
+                        (nxt[j - 1][0] + 1, nxt[j - 1][1]),
+                        key=lambda x: x[0],
+                    ))
+                cur = nxt
+            if best is None:
+                best = cur
+            else:
+                best = [min(b, c, key=lambda x: x[0]) for b, c in zip(best, cur)]
+        row = best
+    distance, spelling = row[-1]
+    return spelling, distance
+
+
+# Romaji to kana
+#
+# Input romaji is parsed into a lattice: every romaji unit of the trie that
+# matches at a position is an edge, plus edges for doubled consonants (っ),
+# m before b/m/p (ん) and a passport-style h after o (おう/おお). Because
+# long vowels are often not written (sato for さとう), any vowel may also
+# be followed by an inserted long vowel. Macrons and circumflexes are split
+# off their vowel (NFD) into a long vowel mark that spells the long vowel
+# of the preceding mora, so satō parses as sa + to + う. Paths are kept only
+# while their reading is a prefix of a reading in the dataset.
+
+# Kunrei-shiki, Nihon-shiki and wapuro spellings accepted on top of Hepburn
+# (whose table also maps ji/zu/o to the historical ぢ/づ/を)
+_EXTRA_UNITS = {
+    'si': 'し', 'ti': 'ち', 'tu': 'つ', 'hu': 'ふ', 'zi': 'じ',
+    'di': 'ぢ', 'du': 'づ', 'wo': 'を', 'nn': 'ん', "n'": 'ん',
+    'sya': 'しゃ', 'syu': 'しゅ', 'syo': 'しょ',
+    'tya': 'ちゃ', 'tyu': 'ちゅ', 'tyo': 'ちょ',
+    'cya': 'ちゃ', 'cyu': 'ちゅ', 'cyo': 'ちょ',
+    'zya': 'じゃ', 'zyu': 'じゅ', 'zyo': 'じょ',
+    'jya': 'じゃ', 'jyu': 'じゅ', 'jyo': 'じょ',
+    'dya': 'ぢゃ', 'dyu': 'ぢゅ', 'dyo': 'ぢょ',
+    'n': 'ん',
+}
+
+# Combining macron; combining circumflexes are folded onto it
+_LONG_MARK = '\u0304'
+_CIRCUMFLEX = '\u0302'
+
+# Long vowels that may follow a mora ending in the given vowel
+_LONG_INSERTIONS = {
+    'a': ('あ',), 'i': ('い',), 'u': ('う',), 'e': ('え', 'い'), 'o': ('う', 'お'),
+}
+
+_KANA_FINAL_VOWEL = {
+    'あ': 'a', 'い': 'i', 'う': 'u', 'え': 'e', 'お': 'o',
+}
+
+
+def _build_trie() -> dict:
+    units = {}
+    for table in (BASIC, YOUON):
+        for kana, romaji in table.items():
+            if kana in ('ぁ', 'ぃ', 'ぅ', 'ぇ', 'ぉ'):
+                continue
+            units.setdefault(romaji, []).append(kana)
+    for romaji, kana in _EXTRA_UNITS.items():
+        units.setdefault(romaji, []).append(kana)
+    trie = {}
+    for romaji, kana_list in units.items():
+        node = trie
+        for ch in romaji:
+            node = node.setdefault(ch, {})
+        node[''] = tuple(kana_list)
+    return trie
+
+
+_TRIE = _build_trie()
+
+_ROMAJI_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz\'' + _LONG_MARK)
+
+
+def _final_vowel(reading: str) -> str:
+    """Return the vowel a reading ends in, or '' (for ん, っ, ...)."""
+    last = reading[-1:]
+    if last in _KANA_FINAL_VOWEL:
+        return _KANA_FINAL_VOWEL[last]
+    if last in ('ゃ', 'ゅ', 'ょ'):
+        return {'ゃ': 'a', 'ゅ': 'u', 'ょ': 'o'}[last]
+    romaji = BASIC.get(last, '')
+    return romaji[-1:] if romaji[-1:] in _VOWELS else ''
+
+
+def _lattice_edges(text: str, pos: int, reading: str) -> List[Tuple[int, str]]:
+    """Return the (end, kana) edges of the lattice leaving pos."""
+    edges = []
+    node = _TRIE
+    end = pos
+    while end < len(text) and text[end] in node:
+        node = node[text[end]]
+        end += 1
+        for kana in node.get('', ()):
+            edges.append((end, kana))
+    ch = text[pos]
+    nxt = text[pos + 1] if pos + 1 < len(text) else ''
+    if ch == _LONG_MARK:
+        # Macron or circumflex on the vowel the reading ends in
+        for long_vowel in _LONG_INSERTIONS.get(_final_vowel(reading), ()):
+            edges.append((pos + 1, long_vowel))
+    elif ch == 'm' and nxt in ('b', 'm', 'p'):
+        # Passport-style ん (homma); mm may also be a doubled consonant
+        edges.append((pos + 1, 'ん'))
+        if nxt == 'm':
+            edges.append((pos + 1, 'っ'))
+    elif ch == nxt and ch not in _VOWELS and ch not in ('n', "'"):
+        edges.append((pos + 1, 'っ'))
+    elif ch == 't' and text.startswith('ch', pos + 1):
+        edges.append((pos + 1, 'っ'))
+    elif ch == 'h' and _final_vowel(reading) == 'o' and (not nxt or nxt not in _VOWELS + 'y'):
+        # Passport-style long o (ohno, satoh)
+        edges.append((pos + 1, 'う'))
+        edges.append((pos + 1, 'お'))
+    return edges
+
+
+def _get_reading_prefixes(part: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Get the dataset readings and all of their prefixes from cache or build them.
+
+    First names are taken from the original (org) datasets of both genders.
+    """
+    cache_key = ('reading_prefixes', part)
+    if cache_key not in _INDEX_CACHE:
+        readings = set()
+        if part in ('first', 'any'):
+            for names in _get_cached_dataset(kind='org'):
+                readings.update(names)
+        if part in ('last', 'any'):
+            _, _, last_names = _get_cached_dataset(include_last_names=True)
+            readings.update(data['reading'] for data in last_names.values())
+        prefixes = {r[:i] for r in readings for i in range(1, len(r) + 1)}
+        _INDEX_CACHE[cache_key] = (frozenset(readings), frozenset(prefixes))
+    return _INDEX_CACHE[cache_key]
+
+
+def _literal_reading(text: str) -> Optional[str]:
+    """Convert romaji with the fewest units and no inserted long vowels."""
+    # best[i]: (units, reading) of the best parse of text[:i]
+    best = [None] * (len(text) + 1)
+    best[0] = (0, '')
+    for pos in range(len(text)):
+        if best[pos] is None:
+            continue
+        units, reading = best[pos]
+        for end, kana in _lattice_edges(text, pos, reading):
+            if best[end] is None or units + 1 < best[end][0]:
+                best[end] = (units + 1, reading + kana)
+    return best[-1][1] if best[-1] is not None else None
+
+
+@lru_cache(maxsize=65536)
+def _romaji_to_kana(text: str, part: str) -> Tuple[str, ...]:
+    readings, prefixes = _get_reading_prefixes(part)
+    found = {}
+    # explored[(pos, reading)]: fewest long vowel insertions seen for the state
+    explored = {}
+    stack = [(0, '', 0)]
+    while stack:
+        pos, reading, inserted = stack.pop()
+        if explored.get((pos, reading), inserted + 1) <= inserted:
+            continue
+        explored[pos, reading] = inserted
+        if pos == len(text):
+            if reading in readings and found.get(reading, inserted + 1) > inserted:
+                found[reading] = inserted
+            continue
+        for end, kana in _lattice_edges(text, pos, reading):
+            step = reading + kana
+            if step not in prefixes:
+                continue
+            stack.append((end, step, inserted))
+            for long_vowel in _LONG_INSERTIONS.get(_final_vowel(step), ()):
+                if step + long_vowel in prefixes:
+                    stack.append((end, step + long_vowel, inserted + 1))
+
+    if found:
+        return tuple(sorted(found, key=lambda r: (found[r], r)))
+    literal = _literal_reading(text)
+    return (literal,) if literal else ()
+
+
+def romaji_to_kana(
+    text: str,
+    part: Literal['last', 'first', 'any'] = 'any'
+) -> List[str]:
+    """
+    Convert a romaji name to its candidate hiragana readings.
+
+    Hepburn (sato, shinji), Kunrei-shiki (sinzi), wapuro (satou), keyboard
+    (akiwo), macron or circumflex (satō, satô) and passport (satoh)
+    spellings are accepted. Since romaji is ambiguous (sato may be さと or
+    さとう, kenichi may be けにち or けんいち), all readings the input can
+    spell are considered and only those found in the dataset are returned.
+    If none is found, the literal conversion is returned instead.
+
+    Args:
+        text: Romaji spelling of a last name or first name (case and
+              spaces are ignored)
+        part: 'last' or 'first' to keep readings of last or first names
+              only, 'any' to keep both
+
+    Returns:
+        Candidate readings, those closest to the literal spelling first.
+        Empty if the text is not valid romaji.
+
+    Examples:
+        >>> romaji_to_kana('Saitoh', part='last')
+        ['さいとう']
+        >>> romaji_to_kana('yuki')
+        ['ゆき', 'ゆうき']
+        >>> romaji_to_kana('kenichi', part='first')
+        ['けんいち']
+    """
+    if part not in ('last', 'first', 'any'):
+        raise ValueError(f"part must be 'last', 'first' or 'any', got '{part}'")
+    text = unicodedata.normalize('NFD', text.lower()).replace(_CIRCUMFLEX, _LONG_MARK)
+    text = ''.join(ch for ch in text if ch in _ROMAJI_CHARS)
+    if not text:
+        return []
+    return list(_romaji_to_kana(text, part))
+
+
+def romaji_to_kana_many(
+    texts: Iterable[str],
+    part: Literal['last', 'first', 'any'] = 'any'
+) -> List[List[str]]:
+    """
+    Convert many romaji names to candidate readings at once.
+
+    Args:
+        texts: Romaji spellings
+        part: See romaji_to_kana
+
+    Returns:
+        List of candidate lists in input order
+    """
+    return [romaji_to_kana(text, part=part) for text in texts]
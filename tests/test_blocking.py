@@ -0,0 +1,64 @@
+"""Tests for blocking module."""
+
+import pytest
+from japanese_personal_name_dataset import blocking_keys, blocking_keys_many
+
+
+class TestBlockingKeys:
+    """Test blocking_keys function."""
+
+    def test_variant_kanji_share_key(self):
+        """Test that variant spellings of a surname share a key."""
+        keys = {blocking_keys(k, part='last') for k in ('斉藤', '齋藤', '斎藤')}
+        assert len(keys) == 1
+
+    def test_kana_and_romaji_share_key(self):
+        """Test that kana and romaji spellings match the kanji key."""
+        key = blocking_keys('斎藤', part='last')
+        for name in ('さいとう', 'サイトウ', 'ｻｲﾄｳ', 'Saito', 'SAITOH', 'Saitō', 'saitou'):
+            assert blocking_keys(name) == key
+
+    def test_romaji_systems(self):
+        """Test Hepburn, Kunrei and long vowel variants."""
+        assert blocking_keys('Shinji') == blocking_keys('sinzi')
+        assert blocking_keys('Ohno') == blocking_keys('Oono') == blocking_keys('おおの')
+        assert blocking_keys('Jumpei') == blocking_keys('じゅんぺい')
+
+    def test_long_vowel_runs(self):
+        """Test that shortened long vowels inside vowel runs still match."""
+        assert blocking_keys('Keichi') == blocking_keys('けいいち')
+        assert blocking_keys('Shigei') == blocking_keys('しげえい')
+        assert blocking_keys('Oouchi') == blocking_keys('Ouchi') == blocking_keys('おおうち')
+
+    def test_keys_are_64bit_ints(self):
+        """Test the key type and range."""
+        for key in blocking_keys('佐藤'):
+            assert isinstance(key, int)
+            assert 0 <= key < 2 ** 64
+
+    def test_different_names_differ(self):
+        """Test that different surnames get different keys."""
+        assert blocking_keys('佐藤') != blocking_keys('鈴木')
+
+    def test_unknown_kanji_fallback(self):
+        """Test that unknown kanji names still block with their variants."""
+        assert blocking_keys('鬱髙') == blocking_keys('鬱高')
+        assert len(blocking_keys('鬱髙')) == 1
+
+    def test_empty_name(self):
+        """Test that an empty name has no keys."""
+        assert blocking_keys(' ') == ()
+
+    def test_invalid_part(self):
+        """Test that an invalid part raises ValueError."""
+        with pytest.raises(ValueError):
+            blocking_keys('佐藤', part='middle')
+
+
+class TestBlockingKeysMany:
+    """Test blocking_keys_many function."""
+
+    def test_batch_matches_single(self):
+        """Test that batch results match single calls in input order."""
+        names = ['佐藤', 'たろう', 'Taro', '髙橋']
+        assert blocking_keys_many(names) == [blocking_keys(n) for n in names]
@@ -0,0 +1,74 @@
+"""Tests for estimate module."""
+
+import pytest
+from japanese_personal_name_dataset import (
+    estimate_readings,
+    estimate_readings_many,
+    get_readings_for_kanji,
+)
+from japanese_personal_name_dataset.romaji import tokenize
+
+
+class TestEstimateReadings:
+    """Test estimate_readings function."""
+
+    def test_unseen_name(self):
+        """Test estimating a name that is not in the dataset."""
+        assert get_readings_for_kanji('悠真斗') == []
+        results = estimate_readings('悠真斗')
+        assert results[0]['reading'] == 'ゆうまと'
+
+    def test_known_name(self):
+        """Test that a dataset spelling ranks a dataset reading first."""
+        known = {r['reading'] for r in get_readings_for_kanji('健太郎')}
+        assert estimate_readings('健太郎')[0]['reading'] in known
+
+    def test_ranked_scores(self):
+        """Test that candidates are ranked by score and limited by top."""
+        results = estimate_readings('陽菜乃', top=3)
+        assert 0 < len(results) <= 3
+        scores = [r['score'] for r in results]
+        assert scores == sorted(scores, reverse=True)
+        assert all(0 < s <= 1 for s in scores)
+
+    def test_kana_in_name(self):
+        """Test names mixing kana and kanji."""
+        assert estimate_readings('さくら子')[0]['reading'] == 'さくらこ'
+
+    def test_variant_kanji(self):
+        """Test that variant kanji are folded before estimation."""
+        assert estimate_readings('髙橋', part='last')[0]['reading'] == 'たかはし'
+
+    def test_unknown_character(self):
+        """Test that names with unseen characters have no candidates."""
+        assert estimate_readings('鬱') == []
+
+    def test_candidates_are_pronounceable(self):
+        """Test that every candidate splits into morae at character boundaries."""
+        for name in ['奈二', '吾千', '刀幸', '太郎', '亮太', '輝陽']:
+            for result in estimate_readings(name, top=20):
+                reading = result['reading']
+                tokenize(reading)
+                assert reading[0] not in 'んっー'
+
+    def test_invalid_top(self):
+        """Test that top below 1 raises ValueError."""
+        with pytest.raises(ValueError):
+            estimate_readings('太郎', top=0)
+        with pytest.raises(ValueError):
+            estimate_readings('太郎', top=-1)
+
+    def test_invalid_part(self):
+        """Test that an invalid part raises ValueError."""
+        with pytest.raises(ValueError):
+            estimate_readings('太郎', part='middle')
+
+
+class TestEstimateReadingsMany:
+    """Test estimate_readings_many function."""
+
+    def test_batch_matches_single(self):
+        """Test that batch results match single calls in input order."""
+        names = ['悠真斗', '蒼真', '鬱']
+        assert estimate_readings_many(names, top=2) == \
+            [estimate_readings(n, top=2) for n in names]
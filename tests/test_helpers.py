@@ -8,10 +8,12 @@ from japanese_personal_name_dataset import (
     search_by_kanji,
     search_last_name,
     get_last_names,
+    get_last_name_kanji_for_reading,
     get_popular_names,
     is_valid_name,
     get_readings_for_kanji,
 )
+from japanese_personal_name_dataset import helpers
 
 
 class TestRandomGeneration:
@@ -182,6 +184,43 @@ class TestGetLastNames:
             assert r['count'] >= 1000000
 
 
+class TestGetLastNameKanjiForReading:
+    """Test get_last_name_kanji_for_reading function."""
+
+    def test_exact_reading(self):
+        """Test that all kanji spellings of a reading are returned."""
+        results = get_last_name_kanji_for_reading('さいとう')
+        kanji = [r['kanji'] for r in results]
+        assert '斎藤' in kanji
+        assert '齋藤' in kanji
+        for r in results:
+            assert r['reading'] == 'さいとう'
+
+    def test_sorted_by_count(self):
+        """Test that kanji spellings are sorted by population count."""
+        results = get_last_name_kanji_for_reading('わたなべ')
+        assert len(results) > 1
+        for i in range(len(results) - 1):
+            assert results[i]['count'] >= results[i + 1]['count']
+
+    def test_prefix(self):
+        """Test prefix lookup with limit."""
+        results = get_last_name_kanji_for_reading('さ', prefix=True, limit=5)
+        assert len(results) == 5
+        assert results[0]['kanji'] == '佐藤'
+        for r in results:
+            assert r['reading'].startswith('さ')
+
+    def test_no_results(self):
+        """Test lookup of an unknown reading."""
+        assert get_last_name_kanji_for_reading('zzzzzzz') == []
+
+    def test_matches_search_last_name(self):
+        """Test consistency with a full scan of get_last_names."""
+        expected = [r for r in get_last_names() if r['reading'] == 'あべ']
+        assert search_last_name('あべ', search_by='reading') == expected
+
+
 class TestGetPopularNames:
     """Test get_popular_names function."""
 
@@ -249,6 +288,58 @@ class TestGetReadingsForKanji:
         assert len(readings) == len(set(readings))
 
 
+class TestNormalizedMatching:
+    """Test that search and validation helpers normalize their inputs."""
+
+    def test_katakana_reading(self):
+        """Test searching by katakana and half-width kana readings."""
+        assert search_by_reading('タロウ') == search_by_reading('たろう')
+        assert search_by_reading('ﾀﾛｳ') == search_by_reading('たろう')
+
+    def test_variant_kanji_last_name(self):
+        """Test that variant kanji match their common form and vice versa."""
+        kanji = [r['kanji'] for r in search_last_name('髙橋')]
+        assert kanji == ['高橋']
+        kanji = [r['kanji'] for r in search_last_name('斎藤')]
+        assert '齋藤' in kanji
+
+    def test_normalize_disabled(self):
+        """Test exact matching with normalize=False."""
+        results = search_last_name('齋藤', normalize=False)
+        assert [r['kanji'] for r in results] == ['齋藤']
+        assert search_by_reading('タロウ', normalize=False) == []
+
+    def test_is_valid_name_normalized(self):
+        """Test validation with variant kanji, katakana and spaces."""
+        assert is_valid_name('太郎 ', 'タロウ') is True
+        assert is_valid_name('太郎', 'タロウ', normalize=False) is False
+
+    def test_last_name_reading_katakana(self):
+        """Test last name reading lookup with katakana input."""
+        assert search_last_name('サイトウ', search_by='reading') == \
+            search_last_name('さいとう', search_by='reading')
+
+    def test_last_name_reading_normalize_disabled(self, monkeypatch):
+        """Test that normalize=False matches last name readings exactly."""
+        last_names = {
+            '斎藤': {'reading': 'さいとう', 'en': 'saitou', 'count': 2},
+            '西東': {'reading': 'サイトウ', 'en': 'saitou', 'count': 1},
+        }
+        monkeypatch.setattr(helpers, '_CACHE', {('org', True): ({}, {}, last_names)})
+        monkeypatch.setattr(helpers, '_INDEX_CACHE', {})
+
+        def kanji(results):
+            return [r['kanji'] for r in results]
+
+        assert kanji(get_last_name_kanji_for_reading('さいとう')) == ['斎藤', '西東']
+        assert kanji(get_last_name_kanji_for_reading('さいとう', normalize=False)) == ['斎藤']
+        assert kanji(get_last_name_kanji_for_reading('サイ', prefix=True, normalize=False)) == ['西東']
+        assert kanji(search_last_name('イト', search_by='reading', partial=True)) == ['斎藤', '西東']
+        assert kanji(search_last_name(
+            'イト', search_by='reading', partial=True, normalize=False
+        )) == ['西東']
+
+
 class TestCaching:
     """Test dataset caching."""
 
@@ -0,0 +1,68 @@
+"""Tests for normalize module."""
+
+import pytest
+from japanese_personal_name_dataset.normalize import (
+    normalize_reading,
+    normalize_kanji,
+    normalize_many,
+)
+
+
+class TestNormalizeReading:
+    """Test normalize_reading function."""
+
+    def test_hiragana_unchanged(self):
+        """Test that hiragana readings are returned as-is."""
+        assert normalize_reading('たろう') == 'たろう'
+        assert normalize_reading('あーさ') == 'あーさ'
+
+    def test_katakana(self):
+        """Test katakana to hiragana conversion."""
+        assert normalize_reading('タロウ') == 'たろう'
+        assert normalize_reading('ヴァン') == 'ゔぁん'
+
+    def test_half_width_kana(self):
+        """Test half-width kana including voiced sound marks."""
+        assert normalize_reading('ｻｲﾄｳ') == 'さいとう'
+        assert normalize_reading('ｶﾞｸ') == 'がく'
+        assert normalize_reading('ﾎﾟﾁ') == 'ぽち'
+
+    def test_whitespace_removed(self):
+        """Test that ASCII and ideographic spaces are removed."""
+        assert normalize_reading(' さ　とう ') == 'さとう'
+
+
+class TestNormalizeKanji:
+    """Test normalize_kanji function."""
+
+    def test_variant_kanji(self):
+        """Test folding of old-form and variant kanji."""
+        assert normalize_kanji('髙橋') == '高橋'
+        assert normalize_kanji('山﨑') == '山崎'
+        assert normalize_kanji('齋藤') == '斎藤'
+        assert normalize_kanji('渡邊') == '渡辺'
+
+    def test_kana_kept(self):
+        """Test that kana in kanji names are not converted."""
+        assert normalize_kanji('木の実') == '木の実'
+
+    def test_whitespace_removed(self):
+        """Test that spaces are removed."""
+        assert normalize_kanji(' 太郎　') == '太郎'
+
+
+class TestNormalizeMany:
+    """Test normalize_many function."""
+
+    def test_readings(self):
+        """Test bulk reading normalization keeps input order."""
+        assert normalize_many(['ﾀﾛｳ', 'ハナコ']) == ['たろう', 'はなこ']
+
+    def test_kanji(self):
+        """Test bulk kanji normalization."""
+        assert normalize_many(['髙橋', '邉'], kind='kanji') == ['高橋', '辺']
+
+    def test_invalid_kind(self):
+        """Test that an invalid kind raises ValueError."""
+        with pytest.raises(ValueError):
+            normalize_many(['たろう'], kind='romaji')
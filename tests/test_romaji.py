@@ -0,0 +1,225 @@
+"""Tests for romaji module."""
+
+import pytest
+from japanese_personal_name_dataset.romaji import (
+    tokenize,
+    romanize,
+    romanize_many,
+    matches_romaji,
+    romaji_candidates,
+    closest_romaji,
+    romaji_to_kana,
+    romaji_to_kana_many,
+)
+
+
+class TestTokenize:
+    """Test tokenize function."""
+
+    def test_basic(self):
+        """Test splitting plain kana."""
+        assert tokenize('あい') == ['あ', 'い']
+
+    def test_youon(self):
+        """Test that youon are kept as one mora."""
+        assert tokenize('きょうこ') == ['きょ', 'う', 'こ']
+
+    def test_markers(self):
+        """Test sokuon, hatsuon and long vowel marker tokens."""
+        assert tokenize('いっき') == ['い', 'Q', 'き']
+        assert tokenize('けんいち') == ['け', 'N', 'い', 'ち']
+        assert tokenize('あーさ') == ['あ', 'H', 'さ']
+
+    def test_unknown_char_raises(self):
+        """Test that a stray small youon raises ValueError."""
+        with pytest.raises(ValueError):
+            tokenize('あゃ')
+
+
+class TestRomanize:
+    """Test romanize function."""
+
+    def test_hepburn(self):
+        """Test passport Hepburn spelling."""
+        assert romanize('さとう') == 'sato'
+        assert romanize('おおの') == 'ono'
+        assert romanize('じゅんぺい') == 'jumpei'
+        assert romanize('いっちゅう') == 'itchu'
+        assert romanize('けいこ') == 'keiko'
+
+    def test_macron(self):
+        """Test revised Hepburn with macrons."""
+        assert romanize('さとう', style='macron') == 'satō'
+        assert romanize('ゆうき', style='macron') == 'yūki'
+        assert romanize('けんいち', style='macron') == "ken'ichi"
+        assert romanize('あーさ', style='macron') == 'āsa'
+
+    def test_wapuro(self):
+        """Test kana-as-written spelling."""
+        assert romanize('さとう', style='wapuro') == 'satou'
+        assert romanize('いっちゅう', style='wapuro') == 'icchuu'
+        assert romanize('かをる', style='wapuro') == 'kaoru'
+        assert romanize('かづき', style='wapuro') == 'kazuki'
+
+    def test_full_name_and_katakana(self):
+        """Test space-separated full names and katakana input."""
+        assert romanize('サトウ ジュンイチ') == 'sato junichi'
+
+    def test_invalid_style(self):
+        """Test that an unknown style raises ValueError."""
+        with pytest.raises(ValueError):
+            romanize('さとう', style='kunrei')
+
+    def test_untokenizable_reading(self):
+        """Test that a reading with a stray small youon raises ValueError."""
+        with pytest.raises(ValueError):
+            romanize('あゃ')
+
+
+class TestRomanizeMany:
+    """Test romanize_many function."""
+
+    def test_batch_matches_single(self):
+        """Test that batch results match single calls in input order."""
+        readings = ['さとう', 'たろう', 'はなこ']
+        assert romanize_many(readings, style='macron') == \
+            [romanize(r, style='macron') for r in readings]
+
+
+class TestMatchesRomaji:
+    """Test matches_romaji function."""
+
+    def test_hepburn_specials(self):
+        """Test Hepburn spellings of special morae."""
+        assert matches_romaji('しんじ', 'shinji')
+        assert matches_romaji('つとむ', 'tsutomu')
+        assert matches_romaji('いっき', 'ikki')
+
+    def test_sokuon_and_hatsuon_variants(self):
+        """Test tchi/cchi and n/m/n' alternatives."""
+        assert matches_romaji('えっちゅう', 'etchu')
+        assert matches_romaji('えっちゅう', 'ecchuu')
+        assert matches_romaji('じゅんぺい', 'jumpei')
+        assert matches_romaji('じゅんぺい', 'junpei')
+        assert matches_romaji('けんいち', "ken'ichi")
+
+    def test_long_vowels_mixed(self):
+        """Test that each long vowel may be kept or shortened."""
+        assert matches_romaji('さとう', 'satou')
+        assert matches_romaji('さとう', 'sato')
+        assert matches_romaji('あいいちろう', 'aichirou')
+
+    def test_mismatch(self):
+        """Test spellings that are not accepted."""
+        assert not matches_romaji('さとう', 'satoh')
+        assert not matches_romaji('さとう', 'satouu')
+        assert not matches_romaji('さとう', 'sat')
+
+    def test_agrees_with_candidates(self):
+        """Test that matching agrees with candidate enumeration."""
+        reading = 'こうたろう'
+        candidates = set(romaji_candidates(reading))
+        assert candidates == {'koutarou', 'kotarou', 'koutaro', 'kotaro'}
+        for candidate in candidates:
+            assert matches_romaji(reading, candidate)
+
+
+class TestRomajiCandidates:
+    """Test romaji_candidates function."""
+
+    def test_lazy_generator(self):
+        """Test that candidates are generated lazily without duplicates."""
+        gen = romaji_candidates('おおう' * 20)
+        first = [next(gen) for _ in range(5)]
+        assert len(set(first)) == 5
+
+
+class TestClosestRomaji:
+    """Test closest_romaji function."""
+
+    def test_accepted_spelling(self):
+        """Test that an accepted spelling is returned with distance 0."""
+        assert closest_romaji('さとう', 'sato') == ('sato', 0)
+        assert closest_romaji('けんいち', "ken'ichi") == ("ken'ichi", 0)
+
+    def test_proposes_fix(self):
+        """Test that a rejected spelling gets the nearest accepted one."""
+        assert closest_romaji('しんじ', 'sinji') == ('shinji', 1)
+        assert closest_romaji('いっき', 'iki') == ('ikki', 1)
+        assert closest_romaji('さとう', 'satoh') == ('satou', 1)
+
+    def test_result_is_accepted(self):
+        """Test that the proposal is always accepted by matches_romaji."""
+        for reading, romaji in [('じゅんぺい', 'zyunpei'), ('たろう', 'tarooo'), ('あい', '')]:
+            spelling, _ = closest_romaji(reading, romaji)
+            assert matches_romaji(reading, spelling)
+
+    def test_agrees_with_matches_romaji(self):
+        """Test that distance 0 means exactly that matches_romaji accepts it."""
+        for reading, romaji in [('さとう', 'sato'), ('さとう', 'Sato'), ('はなこ', 'HANAKO')]:
+            _, distance = closest_romaji(reading, romaji)
+            assert (distance == 0) == matches_romaji(reading, romaji)
+        assert closest_romaji('さとう', 'Sato') == ('sato', 1)
+
+
+class TestRomajiToKana:
+    """Test romaji_to_kana function."""
+
+    def test_hepburn_and_wapuro(self):
+        """Test Hepburn and kana-as-written input."""
+        assert romaji_to_kana('Takahashi', part='last') == ['たかはし']
+        assert romaji_to_kana('tarou', part='first') == ['たろう']
+        assert romaji_to_kana('jumpei', part='first') == ['じゅんぺい']
+
+    def test_kunrei(self):
+        """Test Kunrei-shiki input."""
+        assert romaji_to_kana('sinzi', part='first') == ['しんじ']
+
+    def test_long_vowel_ambiguity(self):
+        """Test that unwritten long vowels are resolved against the dataset."""
+        assert romaji_to_kana('Sato', part='last') == ['さとう']
+        assert romaji_to_kana('yuki') == ['ゆき', 'ゆうき']
+        assert romaji_to_kana('Saitoh', part='last') == ['さいとう']
+        assert romaji_to_kana('Ōno', part='last') == ['おおの']
+
+    def test_macron_after_consonant(self):
+        """Test macron and circumflex long vowels inside a name."""
+        assert romaji_to_kana('satō', part='last') == ['さとう']
+        assert romaji_to_kana('Kōno', part='last') == ['こうの']
+        assert romaji_to_kana('kōta', part='first') == ['こうた']
+        assert romaji_to_kana('yūki', part='first') == ['ゆうき']
+        assert romaji_to_kana('Saitô', part='last') == ['さいとう']
+
+    def test_macron_round_trip(self):
+        """Test that macron romanizations convert back to their reading."""
+        for reading in ['さとう', 'こうの', 'ゆうき', 'しょうへい', 'じゅんいち']:
+            assert reading in romaji_to_kana(romanize(reading, style='macron'))
+
+    def test_passport_m_before_bmp(self):
+        """Test that passport-style m before b/m/p converts back to ん."""
+        assert romaji_to_kana('Homma', part='last') == ['ほんま']
+        for reading in ['ほんま', 'けんめい', 'なんば', 'じゅんぺい']:
+            assert reading in romaji_to_kana(romanize(reading, style='hepburn'))
+
+    def test_hatsuon_ambiguity(self):
+        """Test that n before a vowel is resolved against the dataset."""
+        assert romaji_to_kana('kenichi', part='first') == ['けんいち']
+        assert romaji_to_kana("ken'ichi", part='first') == ['けんいち']
+
+    def test_fallback_to_literal(self):
+        """Test the literal conversion for names not in the dataset."""
+        assert romaji_to_kana('zozozo') == ['ぞぞぞ']
+
+    def test_invalid_romaji(self):
+        """Test that text that is not romaji has no candidates."""
+        assert romaji_to_kana('xyz') == []
+        assert romaji_to_kana('') == []
+
+
+class TestRomajiToKanaMany:
+    """Test romaji_to_kana_many function."""
+
+    def test_batch_matches_single(self):
+        """Test that batch results match single calls in input order."""
+        texts = ['Sato', 'hanako', 'xyz']
+        assert romaji_to_kana_many(texts) == [romaji_to_kana(t) for t in texts]